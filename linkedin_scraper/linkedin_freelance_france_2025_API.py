@@ -6,15 +6,27 @@
 # - Background scraping with live progress logs
 # ==============================
 
+import asyncio
+import csv
+import json
 import os
+import re
+import stat
 import time
-from threading import Lock
-from typing import Optional, Dict, Any, List
-
-import pandas as pd
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import partial
+from queue import Queue, Empty
+from threading import Lock, Thread
+from uuid import uuid4
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from pydantic import BaseModel
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -28,6 +40,61 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+try:
+    import aiohttp
+except ImportError:  # only needed for use_api=True
+    aiohttp = None
+
+# ==============================
+# Selectors
+# ==============================
+
+SEL_CARD = (By.CSS_SELECTOR, ".job-card-container--clickable")
+SEL_RESULTS_LIST = (By.CSS_SELECTOR, "div.jobs-search-results-list")
+SEL_NEXT_BUTTON = (By.CSS_SELECTOR, "button.jobs-search-pagination__button--next")
+SEL_DETAIL_PANE = (By.CSS_SELECTOR, "#job-details, .jobs-description-content__text")
+SEL_DETAIL_TITLE = (
+    By.CSS_SELECTOR,
+    ".job-details-jobs-unified-top-card__job-title a",
+)
+
+SEL_TITLE = (By.CSS_SELECTOR, "a.job-card-list__title--link")
+SEL_COMPANY = (By.CSS_SELECTOR, ".artdeco-entity-lockup__subtitle span")
+SEL_LOCATION = (By.CSS_SELECTOR, ".job-card-container__metadata-wrapper li")
+SEL_INFO = (By.CSS_SELECTOR, "div.t-14.mt5")
+SEL_COMPANY_DESC = (By.CSS_SELECTOR, "p.jobs-company__company-description")
+SEL_JOB_DESC = (
+    By.CSS_SELECTOR,
+    "#job-details, .jobs-box__html-content, .jobs-description-content__text",
+)
+SEL_RECRUITER_SEC = (
+    By.CSS_SELECTOR,
+    ".job-details-people-who-can-help__section--two-pane",
+)
+SEL_RECRUITER_NAME = (By.CSS_SELECTOR, "span.jobs-poster__name strong")
+SEL_RECRUITER_PROFILE = (By.CSS_SELECTOR, "a[href*='/in/']")
+SEL_RECRUITER_PRES = (By.CSS_SELECTOR, "div.text-body-small.t-black")
+
+# Same selectors, passed as an argument to the in-page JS queries
+JS_SELECTORS = {
+    "card": SEL_CARD[1],
+    "resultsList": SEL_RESULTS_LIST[1],
+    "detailPane": SEL_DETAIL_PANE[1],
+    "detailTitle": SEL_DETAIL_TITLE[1],
+    "title": SEL_TITLE[1],
+    "company": SEL_COMPANY[1],
+    "location": SEL_LOCATION[1],
+    "info": SEL_INFO[1],
+    "companyDesc": SEL_COMPANY_DESC[1],
+    "jobDesc": SEL_JOB_DESC[1],
+    "recruiterSec": SEL_RECRUITER_SEC[1],
+    "recruiterName": SEL_RECRUITER_NAME[1],
+    "recruiterProfile": SEL_RECRUITER_PROFILE[1],
+    "recruiterPres": SEL_RECRUITER_PRES[1],
+}
+
 
 # ==============================
 # FastAPI app + global state
@@ -45,21 +112,57 @@ app.add_middleware(
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-SCRAPE_STATE: Dict[str, Any] = {
-    "running": False,
-    "logs": [],
-    "result": None,
-}
-state_lock = Lock()
+MAX_FINISHED_JOBS = 50
+
+
+@dataclass
+class JobState:
+    running: bool = True
+    logs: deque = field(default_factory=lambda: deque(maxlen=200))
+    result: Optional[dict] = None
+    # (event loop, queue) per /scrape_stream client
+    subscribers: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = field(
+        default_factory=set
+    )
+    # Written from the scraper thread, read from the event loop
+    lock: Lock = field(default_factory=Lock)
+
+
+def notify(subscribers, kind: str, payload: Any):
+    """Push an event to /scrape_stream clients.
+
+    Take the subscriber list under job.lock together with the state change
+    it announces, then call this outside the lock.
+    """
+    for loop, queue in subscribers:
+        loop.call_soon_threadsafe(queue.put_nowait, (kind, payload))
+
+
+JOBS: Dict[str, JobState] = {}
+jobs_lock = Lock()
+
+# Job the current scraper thread is logging to (unset for /scrape)
+CURRENT_JOB: ContextVar[Optional[JobState]] = ContextVar("CURRENT_JOB", default=None)
 
 
 def log(msg: str):
-    """Print to console AND store in shared progress state."""
+    """Print to console AND store in the current job's progress state."""
     print(msg)
-    with state_lock:
-        SCRAPE_STATE["logs"].append(msg)
-        if len(SCRAPE_STATE["logs"]) > 200:
-            SCRAPE_STATE["logs"] = SCRAPE_STATE["logs"][-200:]
+    job = CURRENT_JOB.get()
+    if job is None:
+        return
+    with job.lock:
+        job.logs.append(msg)
+        subscribers = list(job.subscribers)
+    notify(subscribers, "log", msg)
+
+
+def get_job(job_id: str) -> JobState:
+    with jobs_lock:
+        job = JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job_id")
+    return job
 
 
 # ==============================
@@ -70,62 +173,248 @@ class ScrapeRequest(BaseModel):
     search_url: str
     max_pages: Optional[int] = 50
     cookie_text: Optional[str] = None  # Netscape cookie file content
+    use_api: Optional[bool] = False  # fetch job details via voyager API
 
 
 # ==============================
 # Selenium driver setup
 # ==============================
 
-def setup_driver(headless: bool = True):
+WEBDRIVER_POOL_MAXSIZE = 20
+
+_base_connection_manager = RemoteConnection._get_connection_manager
+
+
+def _pooled_connection_manager(self):
+    # urllib3 defaults to maxsize=1 per host: keep more sockets alive so
+    # commands from several threads don't serialize or drop connections
+    manager = _base_connection_manager(self)
+    manager.connection_pool_kw["maxsize"] = WEBDRIVER_POOL_MAXSIZE
+    return manager
+
+
+RemoteConnection._get_connection_manager = _pooled_connection_manager
+
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+]
+
+
+_DEFAULT_CHROMEDRIVER = (
+    r"C:\Program Files\Google\Chrome\Application\chromedriver-win64\chromedriver.exe"
+)
+# None lets Selenium Manager locate a matching chromedriver
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH") or (
+    _DEFAULT_CHROMEDRIVER if os.path.exists(_DEFAULT_CHROMEDRIVER) else None
+)
+
+CHROME_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--window-size=1920,1080",
+    # Skip browser subsystems the scraper never uses
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+    # Only text is scraped: skip image and font downloads. Stylesheets stay
+    # on, the scroll container and visibility waits depend on layout.
+    "--blink-settings=imagesEnabled=false",
+]
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+
+def build_options(headless: bool = True) -> Options:
     options = Options()
 
     if headless:
         options.add_argument("--headless=new")
 
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
+    # driver.get returns at DOMContentLoaded; explicit waits do the rest
+    options.page_load_strategy = "eager"
+
+    for arg in CHROME_ARGS:
+        options.add_argument(arg)
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    return options
+
 
-    chromedriver_path = r"C:\Program Files\Google\Chrome\Application\chromedriver-win64\chromedriver.exe"
-    service = Service(executable_path=chromedriver_path)
-    driver = webdriver.Chrome(service=service, options=options)
+def setup_driver(headless: bool = True):
+    service = Service(executable_path=CHROMEDRIVER_PATH)
+    driver = webdriver.Chrome(service=service, options=build_options(headless))
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
     driver.maximize_window()
     return driver
 
 
+# ==============================
+# Warm driver pool
+# ==============================
+
+POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "4"))
+MAX_DRIVER_USES = 50
+CHECKOUT_POLL_SECONDS = 1.0
+
+
+class DriverPool:
+    """Bounded pool of logged-in Chrome drivers reused across scrapes."""
+
+    def __init__(self, size: int = 4, max_uses: int = MAX_DRIVER_USES):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: Queue = Queue()
+        self._uses: Dict[int, int] = {}
+        self._created = 0
+        self._lock = Lock()
+
+    def _new_driver(self):
+        driver = setup_driver(headless=True)
+        load_cookies(driver)
+        driver.get("https://www.linkedin.com/feed/")
+        return driver
+
+    def _reserve(self) -> bool:
+        with self._lock:
+            if self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+
+    def _unreserve(self):
+        with self._lock:
+            self._created -= 1
+
+    def warm(self):
+        """Launch drivers until the pool is full."""
+        while self._reserve():
+            try:
+                driver = self._new_driver()
+            except Exception as e:
+                self._unreserve()
+                log(f"⚠️ Driver pool warm-up failed: {e}")
+                return
+            self._idle.put(driver)
+
+    def _checkout(self):
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except Empty:
+                pass
+
+            if self._reserve():
+                try:
+                    return self._new_driver()
+                except Exception:
+                    self._unreserve()
+                    raise
+
+            # Pool is full: wait for a release, but re-check _reserve()
+            # periodically in case busy drivers were recycled instead
+            try:
+                return self._idle.get(timeout=CHECKOUT_POLL_SECONDS)
+            except Empty:
+                continue
+
+    def _release(self, driver, reusable: bool):
+        uses = self._uses.pop(id(driver), 0) + 1
+        if reusable and uses < self.max_uses:
+            self._uses[id(driver)] = uses
+            self._idle.put(driver)
+            return
+
+        # Recycle drivers that errored, carry a caller's cookies or served
+        # too many scrapes
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self._unreserve()
+
+    @contextmanager
+    def acquire(self, cookie_text: Optional[str] = None):
+        """Check out a driver; one given caller cookies is never re-pooled."""
+        driver = self._checkout()
+        reusable = False
+        try:
+            if cookie_text is not None:
+                # Run purely as the caller, not mixed with the file session
+                driver.delete_all_cookies()
+                load_cookies(driver, cookie_text=cookie_text)
+            yield driver
+            reusable = cookie_text is None
+        finally:
+            self._release(driver, reusable)
+
+    def close(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except Empty:
+                return
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            self._uses.pop(id(driver), None)
+            self._unreserve()
+
+
+DRIVER_POOL = DriverPool(size=POOL_SIZE)
+
+# Selenium is sync: run scrapes off the event loop so status polls stay fast
+EXECUTOR = ThreadPoolExecutor(max_workers=POOL_SIZE)
+
+
+@app.on_event("startup")
+def warm_driver_pool():
+    Thread(target=DRIVER_POOL.warm, daemon=True).start()
+
+
+@app.on_event("shutdown")
+def close_driver_pool():
+    EXECUTOR.shutdown(wait=False)
+    DRIVER_POOL.close()
+
+
 # ==============================
 # Parse & load cookies
 # ==============================
 
-def parse_netscape_cookies(text: str) -> List[dict]:
-    cookies: List[dict] = []
+def parse_netscape_cookies(text: str) -> Iterator[dict]:
     for raw_line in text.splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             continue
-        parts = line.split("\t")
+        parts = line.split("\t", 7)
         if len(parts) < 7:
             continue
+        # Netscape format is canonical: only name/value may carry padding
         domain, _flag, path, secure, expiry, name, value = parts[:7]
-        cookie: Dict[str, Any] = {
+        cookie = {
             "name": name.strip(),
             "value": value.strip(),
             "domain": domain.lstrip("."),
             "path": path,
-            "secure": secure.upper() == "TRUE",
+            "secure": secure == "TRUE",
             "httpOnly": False,
             "sameSite": "Lax",
         }
-        if expiry != "0":
+        if expiry not in ("0", ""):
             try:
                 cookie["expiry"] = int(expiry)
             except ValueError:
                 pass
-        cookies.append(cookie)
-    return cookies
+        yield cookie
 
 
 def load_cookies(
@@ -144,11 +433,9 @@ def load_cookies(
 
     # At this point we have some Netscape cookie text
     driver.get("https://www.linkedin.com")
-    time.sleep(3)
 
-    cookies = parse_netscape_cookies(cookie_text)
     added = 0
-    for cookie in cookies:
+    for cookie in parse_netscape_cookies(cookie_text):
         try:
             driver.add_cookie(cookie)
             added += 1
@@ -157,58 +444,83 @@ def load_cookies(
 
     log(f"✅ Cookies loaded successfully ({added} entries)")
     driver.refresh()
-    time.sleep(4)
 
 
 # ==============================
 # Scroll to load all jobs
 # ==============================
 
-def scroll_to_bottom_by_last_job(driver, max_scrolls=300):
-    log("🔄 Starting ultimate scroll-to-last-job method (2025-proof)...")
-    WebDriverWait(driver, 30).until(
-        EC.presence_of_element_located(
-            (By.CSS_SELECTOR, ".job-card-container--clickable")
-        )
-    )
-    time.sleep(3)
+SCROLL_PAUSE_MS = 800
+SCROLL_STABLE_ROUNDS = 3
+SCROLL_SCRIPT_TIMEOUT = 120
+
+# Ships one integer instead of a handle per card
+COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+# Scrolls the results list inside the page until it stops growing, then
+# returns the card count: one WebDriver round-trip for the whole page.
+SCROLL_LIST_JS = """
+const sel = arguments[0];
+const pause = arguments[1];
+const stableRounds = arguments[2];
+const maxRounds = arguments[3];
+const done = arguments[arguments.length - 1];
+
+const count = () => document.querySelectorAll(sel.card).length;
+const scrollParent = (el) => {
+    for (; el && el !== document.body; el = el.parentElement) {
+        const overflow = getComputedStyle(el).overflowY;
+        if ((overflow === "auto" || overflow === "scroll")
+                && el.scrollHeight > el.clientHeight) {
+            return el;
+        }
+    }
+    return document.scrollingElement;
+};
+
+(async () => {
+    const first = document.querySelector(sel.card);
+    const list = document.querySelector(sel.resultsList)
+        || (first ? scrollParent(first) : document.scrollingElement);
+
+    let stable = 0, lastHeight = -1, lastCount = -1;
+    for (let i = 0; i < maxRounds && stable < stableRounds; i++) {
+        const cards = document.querySelectorAll(sel.card);
+        if (cards.length) {
+            cards[cards.length - 1].scrollIntoView({block: "center"});
+        }
+        list.scrollTop = list.scrollHeight;
+        await new Promise((r) => setTimeout(r, pause));
 
-    no_progress = 0
-    for _ in range(max_scrolls):
-        job_cards = driver.find_elements(
-            By.CSS_SELECTOR, ".job-card-container--clickable"
-        )
-        current_count = len(job_cards)
+        const height = list.scrollHeight, current = count();
+        stable = (height === lastHeight && current === lastCount) ? stable + 1 : 0;
+        lastHeight = height;
+        lastCount = current;
+    }
+    done(count());
+})();
+"""
 
-        if current_count == 0:
-            time.sleep(3)
-            continue
 
-        driver.execute_script(
-            "arguments[0].scrollIntoView({block: 'center'});", job_cards[-1]
-        )
-        driver.execute_script("window.scrollBy(0, -120);")
-        time.sleep(2.8)
+def scroll_to_bottom_by_last_job(driver, max_scrolls=100):
+    log("🔄 Starting ultimate scroll-to-last-job method (2025-proof)...")
+    WebDriverWait(driver, 30).until(
+        EC.presence_of_element_located(SEL_CARD)
+    )
 
-        new_cards = driver.find_elements(
-            By.CSS_SELECTOR, ".job-card-container--clickable"
+    driver.set_script_timeout(SCROLL_SCRIPT_TIMEOUT)
+    try:
+        final_count = driver.execute_async_script(
+            SCROLL_LIST_JS,
+            JS_SELECTORS,
+            SCROLL_PAUSE_MS,
+            SCROLL_STABLE_ROUNDS,
+            max_scrolls,
         )
-        new_count = len(new_cards)
-
-        if new_count > current_count:
-            log(f"   +{new_count - current_count} new jobs → Total: {new_count}")
-            no_progress = 0
-        else:
-            no_progress += 1
-            log(f"   No new jobs ({no_progress}/12)")
-
-        if no_progress >= 12:
-            log("✅ No more jobs loading → Page fully loaded")
-            break
+    except TimeoutException:
+        log("⚠️ Scroll script timed out → using jobs loaded so far")
+        final_count = driver.execute_script(COUNT_JS, JS_SELECTORS["card"])
 
-    final_count = len(
-        driver.find_elements(By.CSS_SELECTOR, ".job-card-container--clickable")
-    )
     log(f"🎉 PAGE FULLY LOADED → {final_count} jobs visible")
     return final_count
 
@@ -221,28 +533,36 @@ def go_to_next_page(driver, current_page=1):
     log(f"➡️ Attempting to go to page {current_page + 1}...")
     try:
         next_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable(
-                (By.CSS_SELECTOR, "button.jobs-search-pagination__button--next")
-            )
+            EC.element_to_be_clickable(SEL_NEXT_BUTTON)
         )
+    except TimeoutException:
+        log("🚫 No 'Next' button → End of pagination")
+        return False
+
+    try:
+        try:
+            old_card = driver.find_element(*SEL_CARD)
+        except NoSuchElementException:
+            old_card = None
+
         driver.execute_script(
             "arguments[0].scrollIntoView({block: 'center'});", next_button
         )
-        time.sleep(1)
-
         try:
             next_button.click()
         except ElementClickInterceptedException:
             driver.execute_script("arguments[0].click();", next_button)
 
         log("✅ Next button clicked")
-        time.sleep(4)
-        driver.execute_script("window.scrollBy(0, 500);")
-        time.sleep(3)
+
+        # The old first card goes stale once the new page replaces the list
+        if old_card is not None:
+            WebDriverWait(driver, 15).until(EC.staleness_of(old_card))
+        WebDriverWait(driver, 15).until(EC.presence_of_element_located(SEL_CARD))
         return current_page + 1
 
     except TimeoutException:
-        log("🚫 No 'Next' button → End of pagination")
+        log("🚫 Next page did not load → Stopping pagination")
         return False
     except Exception as e:
         log(f"⚠️ Error clicking next: {e}")
@@ -253,6 +573,91 @@ def go_to_next_page(driver, current_page=1):
 # Single job extraction
 # ==============================
 
+COLUMNS_ORDER = [
+    "REF",
+    "Company",
+    "Company industry",
+    "Number of employee",
+    "Company description",
+    "Job Title",
+    "Location",
+    "Recruiter name",
+    "Recruiter URL profile",
+    "Recruiter presentation",
+    "Job description",
+    "Job URL",
+]
+
+# Marks the detail pane shown before the click, then selects the card. The
+# marker stays in the page, so a replaced pane never has to round-trip back
+# through Selenium as a (possibly detached) element.
+CLICK_CARD_JS = """
+const card = arguments[0];
+const sel = arguments[1];
+document.querySelectorAll("[data-scraper-prev]").forEach(
+    (el) => el.removeAttribute("data-scraper-prev")
+);
+const pane = document.querySelector(sel.detailPane);
+if (pane) {
+    pane.dataset.scraperPrev = "1";
+}
+card.scrollIntoView({block: "center"});
+card.click();
+"""
+
+# True once the detail pane shows the clicked card's job: its top-card link
+# carries the card's job id, or (if that can't be resolved) the pane
+# marked by CLICK_CARD_JS has been replaced.
+DETAIL_READY_JS = """
+const card = arguments[0];
+const sel = arguments[1];
+
+const pane = document.querySelector(sel.detailPane);
+if (!pane || !pane.innerText.trim()) {
+    return false;
+}
+
+let jobId = card.getAttribute("data-job-id");
+if (!jobId) {
+    const link = card.querySelector(sel.title);
+    const m = link && link.href ? link.href.match(/\\/jobs\\/view\\/(\\d+)/) : null;
+    jobId = m ? m[1] : "";
+}
+const title = document.querySelector(sel.detailTitle);
+if (jobId && title && title.href) {
+    return title.href.includes("/jobs/view/" + jobId);
+}
+return !pane.dataset.scraperPrev;
+"""
+
+EXTRACT_JOB_JS = """
+const card = arguments[0];
+const sel = arguments[1];
+const text = (root, css) => {
+    const el = root ? root.querySelector(css) : null;
+    return el ? el.innerText.trim() : "";
+};
+const href = (el) => (el && el.href) ? el.href : "";
+
+const link = card.querySelector(sel.title);
+const sec = document.querySelector(sel.recruiterSec);
+const profile = sec ? sec.querySelector(sel.recruiterProfile) : null;
+
+return {
+    jobTitle: link ? link.innerText.trim() : "",
+    jobUrl: href(link),
+    company: text(card, sel.company),
+    location: text(card, sel.location),
+    info: text(document, sel.info),
+    companyDesc: text(document, sel.companyDesc),
+    jobDesc: text(document, sel.jobDesc),
+    recruiterName: text(sec, sel.recruiterName),
+    recruiterUrl: href(profile),
+    recruiterPres: text(sec, sel.recruiterPres),
+};
+"""
+
+
 def extract_job(driver, card, index):
     job = {
         "REF": index,
@@ -269,103 +674,178 @@ def extract_job(driver, card, index):
         "Job URL": "",
     }
 
-    try:
-        link = card.find_element(By.CSS_SELECTOR, "a.job-card-list__title--link")
-        job["Job Title"] = link.text.strip()
-        job["Job URL"] = link.get_attribute("href").split("?")[0]
-    except Exception:
-        pass
+    # LinkedIn auto-selects a job on load, so the pane is visible before any
+    # click. Mark the current pane, scroll and click in one round-trip; the
+    # wait below gates on the pane switching to this card's job.
+    driver.execute_script(CLICK_CARD_JS, card, JS_SELECTORS)
 
     try:
-        job["Company"] = card.find_element(
-            By.CSS_SELECTOR, ".artdeco-entity-lockup__subtitle span"
-        ).text.strip()
-    except Exception:
-        pass
+        WebDriverWait(driver, 8).until(
+            lambda d: d.execute_script(DETAIL_READY_JS, card, JS_SELECTORS)
+        )
+        ready = True
+    except TimeoutException:
+        ready = False
 
-    try:
-        job["Location"] = card.find_element(
-            By.CSS_SELECTOR, ".job-card-container__metadata-wrapper li"
-        ).text.strip()
-    except Exception:
-        pass
-
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-    time.sleep(1)
-    try:
-        card.click()
-    except Exception:
-        driver.execute_script("arguments[0].click();", card)
-    time.sleep(5)
+    # Single round-trip for every card + detail pane field
+    data = driver.execute_script(EXTRACT_JOB_JS, card, JS_SELECTORS) or {}
 
-    try:
-        info = driver.find_element(By.CSS_SELECTOR, "div.t-14.mt5").text
+    job["Job Title"] = data.get("jobTitle", "")
+    job["Job URL"] = data.get("jobUrl", "").split("?")[0]
+    job["Company"] = data.get("company", "")
+    job["Location"] = data.get("location", "")
+
+    # Pane fields would belong to the previously selected job
+    if not ready:
+        log(f"  ⚠️ Job {index}: detail pane did not switch → card fields only")
+        return job
+
+    info = data.get("info", "")
+    if info:
         parts = info.split("·")
         job["Company industry"] = parts[0].strip()
         for p in parts:
             if "employee" in p.lower():
                 job["Number of employee"] = p.strip()
-    except Exception:
-        pass
 
-    try:
-        job["Company description"] = driver.find_element(
-            By.CSS_SELECTOR, "p.jobs-company__company-description"
-        ).text.strip()
-    except Exception:
-        pass
+    job["Company description"] = data.get("companyDesc", "")
+    job["Job description"] = data.get("jobDesc", "")
+    job["Recruiter name"] = data.get("recruiterName", "")
+    job["Recruiter URL profile"] = data.get("recruiterUrl", "").split("?")[0]
+    job["Recruiter presentation"] = data.get("recruiterPres", "")
 
-    try:
-        desc = driver.find_element(
-            By.CSS_SELECTOR,
-            "#job-details, .jobs-box__html-content, .jobs-description-content__text",
-        )
-        job["Job description"] = desc.text.strip()
-    except Exception:
-        pass
+    return job
 
-    try:
-        sec = driver.find_element(
-            By.CSS_SELECTOR, ".job-details-people-who-can-help__section--two-pane"
-        )
-        try:
-            job["Recruiter name"] = sec.find_element(
-                By.CSS_SELECTOR, "span.jobs-poster__name strong"
-            ).text.strip()
-        except Exception:
-            pass
-        try:
-            profile = sec.find_element(By.XPATH, ".//a[contains(@href,'/in/')]")
-            job["Recruiter URL profile"] = profile.get_attribute(
-                "href"
-            ).split("?")[0]
-        except Exception:
-            pass
-        try:
-            job["Recruiter presentation"] = sec.find_element(
-                By.CSS_SELECTOR, "div.text-body-small.t-black"
-            ).text.strip()
-        except Exception:
-            pass
-    except Exception:
-        pass
 
-    return job
+# ==============================
+# Voyager API detail fetch
+# ==============================
+
+VOYAGER_JOB_URL = "https://www.linkedin.com/voyager/api/jobs/jobPostings/{}"
+API_CONCURRENCY = 8
+JOB_ID_RE = re.compile(r"/jobs/view/(\d+)")
+
+LIST_CARDS_JS = """
+const sel = arguments[0];
+const text = (root, css) => {
+    const el = root.querySelector(css);
+    return el ? el.innerText.trim() : "";
+};
+return Array.from(document.querySelectorAll(sel.card)).map((card) => {
+    const link = card.querySelector(sel.title);
+    return {
+        jobTitle: link ? link.innerText.trim() : "",
+        jobUrl: link && link.href ? link.href : "",
+        company: text(card, sel.company),
+        location: text(card, sel.location),
+    };
+});
+"""
+
+
+async def fetch_job(session, jid: str, sem) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Return (error, payload); error is None on success."""
+    async with sem:
+        try:
+            async with session.get(VOYAGER_JOB_URL.format(jid)) as resp:
+                if resp.status != 200:
+                    return str(resp.status), {}
+                return None, await resp.json(content_type=None)
+        except Exception as e:
+            return type(e).__name__, {}
+
+
+async def fetch_jobs(
+    cookies: List[dict], ids: List[str]
+) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+    jar = {c["name"]: c["value"] for c in cookies}
+    headers = {
+        "csrf-token": jar.get("JSESSIONID", "").strip('"'),
+        "accept": "application/json",
+        "x-restli-protocol-version": "2.0.0",
+    }
+    sem = asyncio.Semaphore(API_CONCURRENCY)
+    async with aiohttp.ClientSession(cookies=jar, headers=headers) as session:
+        return await asyncio.gather(*(fetch_job(session, j, sem) for j in ids))
+
+
+def extract_jobs_via_api(driver, start_index: int) -> List[dict]:
+    """Read the card list in one hop, then fetch every detail concurrently."""
+    if aiohttp is None:
+        raise RuntimeError("use_api requires the 'aiohttp' package")
+
+    rows = driver.execute_script(LIST_CARDS_JS, JS_SELECTORS) or []
+    ids = []
+    for row in rows:
+        m = JOB_ID_RE.search(row["jobUrl"])
+        ids.append(m.group(1) if m else "")
+
+    fetch_ids = [j for j in ids if j]
+    responses = asyncio.run(fetch_jobs(driver.get_cookies(), fetch_ids))
+    details = {jid: payload for jid, (_, payload) in zip(fetch_ids, responses)}
+
+    # An expired session or bad csrf token fails every fetch: say so
+    errors = [err for err, _ in responses if err is not None]
+    if errors:
+        summary = ", ".join(f"{e}×{n}" for e, n in Counter(errors).most_common())
+        log(f"⚠️ {len(errors)}/{len(fetch_ids)} API fetches failed ({summary})")
+
+    jobs = []
+    for i, (row, jid) in enumerate(zip(rows, ids), start_index):
+        detail = details.get(jid) or {}
+        description = detail.get("description") or {}
+        jobs.append({
+            "REF": i,
+            "Company": row["company"],
+            "Company industry": "",
+            "Number of employee": "",
+            "Company description": "",
+            "Job Title": detail.get("title") or row["jobTitle"],
+            "Location": detail.get("formattedLocation") or row["location"],
+            "Recruiter name": "",
+            "Recruiter URL profile": "",
+            "Recruiter presentation": "",
+            "Job description": (description.get("text") or "").strip(),
+            "Job URL": row["jobUrl"].split("?")[0],
+        })
+    return jobs
 
 
 # ==============================
 # Core scraper
 # ==============================
 
-def run_scraper(search_url: str, max_pages: int = 50, cookie_text: Optional[str] = None):
-    driver = setup_driver(headless=True)
-    results = []
+def iter_browser_jobs(driver, cards, start: int):
+    """Click through the page's cards, yielding each extracted job."""
+    for i, card in enumerate(cards, 1):
+        try:
+            yield extract_job(driver, card, start + i)
+        except (StaleElementReferenceException, Exception) as e:
+            log(f"  ⚠️ Skipped job {i}: {e}")
 
-    try:
-        load_cookies(driver, cookie_text=cookie_text)
+
+def run_scraper(
+    search_url: str,
+    max_pages: int = 50,
+    cookie_text: Optional[str] = None,
+    use_api: bool = False,
+):
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    # Scrapes can run concurrently: suffix keeps same-second runs apart
+    filename = f"linkedin_jobs_{timestamp}_{uuid4().hex[:8]}.csv"
+    file_path = os.path.join(BASE_DIR, filename)
+    saved = 0
+
+    # Rows are streamed to disk as they are extracted: constant memory and
+    # a partial CSV survives a crash mid-scrape
+    with DRIVER_POOL.acquire(cookie_text=cookie_text) as driver, open(
+        file_path, "x", newline="", encoding="utf-8-sig"
+    ) as csv_f:
+        writer = csv.DictWriter(csv_f, fieldnames=COLUMNS_ORDER)
+        writer.writeheader()
 
         driver.get(search_url)
-        time.sleep(10)
+        WebDriverWait(driver, 20).until(EC.presence_of_element_located(SEL_CARD))
 
         current_page = 1
         total_jobs_extracted = 0
@@ -377,86 +857,70 @@ def run_scraper(search_url: str, max_pages: int = 50, cookie_text: Optional[str]
 
             scroll_to_bottom_by_last_job(driver)
 
-            cards = driver.find_elements(
-                By.CSS_SELECTOR, ".job-card-container--clickable"
-            )
-            log(f"📌 Extracting {len(cards)} jobs from page {current_page}...")
-
-            for i, card in enumerate(cards, 1):
-                try:
-                    data = extract_job(driver, card, total_jobs_extracted + i)
-                    results.append(data)
-                    log(
-                        f"  {total_jobs_extracted + i:3d}. "
-                        f"{data['Job Title'][:60]:60} → {data['Recruiter name'] or '—'}"
-                    )
-                except (StaleElementReferenceException, Exception) as e:
-                    log(f"  ⚠️ Skipped job {i}: {e}")
-
-            total_jobs_extracted += len(cards)
+            if use_api:
+                jobs = extract_jobs_via_api(driver, total_jobs_extracted + 1)
+                page_size = len(jobs)
+                log(f"📌 Fetched {page_size} jobs from page {current_page} via API")
+            else:
+                cards = driver.find_elements(*SEL_CARD)
+                page_size = len(cards)
+                log(f"📌 Extracting {page_size} jobs from page {current_page}...")
+                jobs = iter_browser_jobs(driver, cards, total_jobs_extracted)
+
+            for data in jobs:
+                writer.writerow(data)
+                csv_f.flush()
+                saved += 1
+                log(
+                    f"  {data['REF']:3d}. "
+                    f"{data['Job Title'][:60]:60} → {data['Recruiter name'] or '—'}"
+                )
+
+            total_jobs_extracted += page_size
 
             next_page = go_to_next_page(driver, current_page)
             if not next_page:
                 log("🎉 No more pages → Scraping finished!")
                 break
             current_page = next_page
-            time.sleep(5)
-
-        df = pd.DataFrame(results)
-        columns_order = [
-            "REF",
-            "Company",
-            "Company industry",
-            "Number of employee",
-            "Company description",
-            "Job Title",
-            "Location",
-            "Recruiter name",
-            "Recruiter URL profile",
-            "Recruiter presentation",
-            "Job description",
-            "Job URL",
-        ]
-        if not df.empty:
-            df = df[columns_order]
-
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        filename = f"linkedin_jobs_{timestamp}.csv"
-        file_path = os.path.join(BASE_DIR, filename)
-        df.to_csv(file_path, index=False, encoding="utf-8-sig")
-        log(f"🎊 SUCCESS! {len(results)} jobs saved → {filename}")
-
-        return {
-            "status": "ok",
-            "total_jobs": len(results),
-            "file": filename,
-        }
 
-    finally:
-        driver.quit()
+    log(f"🎊 SUCCESS! {saved} jobs saved → {filename}")
+
+    return {
+        "status": "ok",
+        "total_jobs": saved,
+        "file": filename,
+    }
 
 
 # ==============================
 # Background task wrapper
 # ==============================
 
-def run_scraper_task(search_url: str, max_pages: int = 50, cookie_text: Optional[str] = None):
-    with state_lock:
-        SCRAPE_STATE["running"] = True
-        SCRAPE_STATE["logs"] = []
-        SCRAPE_STATE["result"] = None
+def run_scraper_task(
+    job: JobState,
+    search_url: str,
+    max_pages: int = 50,
+    cookie_text: Optional[str] = None,
+    use_api: bool = False,
+):
+    CURRENT_JOB.set(job)
 
     try:
-        result = run_scraper(search_url, max_pages, cookie_text=cookie_text)
-        with state_lock:
-            SCRAPE_STATE["result"] = result
+        result = run_scraper(
+            search_url, max_pages, cookie_text=cookie_text, use_api=use_api
+        )
     except Exception as e:
-        with state_lock:
-            SCRAPE_STATE["result"] = {"status": "error", "detail": str(e)}
-            SCRAPE_STATE["logs"].append(f"ERROR: {e}")
+        result = {"status": "error", "detail": str(e)}
+        log(f"ERROR: {e}")
     finally:
-        with state_lock:
-            SCRAPE_STATE["running"] = False
+        CURRENT_JOB.set(None)
+
+    with job.lock:
+        job.result = result
+        job.running = False
+        subscribers = list(job.subscribers)
+    notify(subscribers, "done", result)
 
 
 # ==============================
@@ -465,9 +929,18 @@ def run_scraper_task(search_url: str, max_pages: int = 50, cookie_text: Optional
 
 # Direct endpoint (still usable)
 @app.post("/scrape")
-def scrape_linkedin(req: ScrapeRequest):
+async def scrape_linkedin(req: ScrapeRequest):
     try:
-        result = run_scraper(req.search_url, req.max_pages, cookie_text=req.cookie_text)
+        result = await asyncio.get_running_loop().run_in_executor(
+            EXECUTOR,
+            partial(
+                run_scraper,
+                req.search_url,
+                req.max_pages,
+                cookie_text=req.cookie_text,
+                use_api=bool(req.use_api),
+            ),
+        )
         return result
     except Exception as e:
         return JSONResponse(
@@ -478,43 +951,101 @@ def scrape_linkedin(req: ScrapeRequest):
 
 # Async flow: start + status for live progress
 @app.post("/scrape_start")
-def scrape_start(req: ScrapeRequest, background_tasks: BackgroundTasks):
-    with state_lock:
-        if SCRAPE_STATE["running"]:
-            raise HTTPException(status_code=409, detail="A scrape is already running")
-        SCRAPE_STATE["logs"] = ["Starting scrape..."]
-        SCRAPE_STATE["result"] = None
-        SCRAPE_STATE["running"] = True
-
-    background_tasks.add_task(
+async def scrape_start(req: ScrapeRequest):
+    job_id = uuid4().hex
+    job = JobState()
+    job.logs.append("Starting scrape...")
+
+    with jobs_lock:
+        # Forget the oldest finished jobs so JOBS stays bounded
+        finished = [jid for jid, j in JOBS.items() if not j.running]
+        for jid in finished[:-MAX_FINISHED_JOBS]:
+            del JOBS[jid]
+        JOBS[job_id] = job
+
+    EXECUTOR.submit(
         run_scraper_task,
+        job,
         req.search_url,
         req.max_pages,
         req.cookie_text,
+        bool(req.use_api),
     )
-    return {"status": "started"}
+    return {"status": "started", "job_id": job_id}
 
 
-@app.get("/scrape_status")
-def scrape_status():
-    with state_lock:
-        return {
-            "running": SCRAPE_STATE["running"],
-            "logs": list(SCRAPE_STATE["logs"]),
-            "result": SCRAPE_STATE["result"],
-        }
+@app.get("/scrape_status/{job_id}")
+async def scrape_status(job_id: str):
+    job = get_job(job_id)
+    with job.lock:
+        running = job.running
+        logs = list(job.logs)
+        result = job.result
+    return {"running": running, "logs": logs, "result": result}
+
+
+def sse(data: Any, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+async def event_gen(job: JobState):
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    subscriber = (loop, queue)
+
+    # Snapshot + subscribe atomically so no line is missed or duplicated
+    with job.lock:
+        backlog = list(job.logs)
+        running = job.running
+        result = job.result
+        job.subscribers.add(subscriber)
+
+    try:
+        for msg in backlog:
+            yield sse(msg)
+        if not running:
+            yield sse(result, event="done")
+            return
+
+        while True:
+            kind, payload = await queue.get()
+            if kind == "done":
+                yield sse(payload, event="done")
+                return
+            yield sse(payload)
+    finally:
+        with job.lock:
+            job.subscribers.discard(subscriber)
+
+
+@app.get("/scrape_stream/{job_id}")
+async def scrape_stream(job_id: str):
+    job = get_job(job_id)
+    return StreamingResponse(
+        event_gen(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
 
 
 @app.get("/download/{filename}")
-def download_csv(filename: str):
+async def download_csv(filename: str):
     safe_name = os.path.basename(filename)
     file_path = os.path.join(BASE_DIR, safe_name)
 
-    if not os.path.exists(file_path):
+    # Single stat, reused by FileResponse instead of stat-ing again
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(file_stat.st_mode):
         raise HTTPException(status_code=404, detail="File not found")
 
     return FileResponse(
         file_path,
         media_type="text/csv",
         filename=safe_name,
+        stat_result=file_stat,
+        headers={"Cache-Control": "no-store"},
     )
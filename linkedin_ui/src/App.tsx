@@ -16,6 +16,7 @@ function App() {
   const [error, setError] = useState<string>("");
 
   const [logs, setLogs] = useState<string[]>([]);
+  const [stream, setStream] = useState<EventSource | null>(null);
   const [pollId, setPollId] = useState<number | null>(null);
 
   // Cookies
@@ -39,7 +40,11 @@ function App() {
     setResult(null);
     setLogs([]);
 
-    // Clear previous polling if any
+    // Close previous stream / fallback polling if any
+    if (stream !== null) {
+      stream.close();
+      setStream(null);
+    }
     if (pollId !== null) {
       window.clearInterval(pollId);
       setPollId(null);
@@ -67,37 +72,69 @@ function App() {
         );
       }
 
-      // 2) Poll status
-      const id = window.setInterval(async () => {
-        try {
-          const statusResp = await fetch("http://127.0.0.1:8000/scrape_status");
-          if (!statusResp.ok) return;
+      const { job_id: jobId } = await startResp.json();
 
-          const status = await statusResp.json();
+      // 2) Stream progress logs
+      const es = new EventSource(
+        "http://127.0.0.1:8000/scrape_stream/" + encodeURIComponent(jobId)
+      );
 
-          if (Array.isArray(status.logs)) {
-            setLogs(status.logs);
-          }
+      es.onmessage = (event) => {
+        const line = JSON.parse(event.data);
+        setLogs((prev) => [...prev, line].slice(-200));
+      };
 
-          if (status.result) {
-            setResult(status.result);
+      const finish = (status: any) => {
+        setLoading(false);
+        if (status) {
+          setResult(status);
+          if (status.status === "error") {
+            setError(status.detail || "Scrape failed");
           }
+        }
+      };
+
+      es.addEventListener("done", (event) => {
+        const status = JSON.parse((event as MessageEvent).data);
+        es.close();
+        setStream(null);
+        finish(status);
+      });
 
-          if (!status.running) {
-            setLoading(false);
-            window.clearInterval(id);
-            setPollId(null);
+      // Stream dropped while the scrape keeps running: fall back to polling
+      // the job's status so the result and CSV link still show up
+      es.onerror = () => {
+        es.close();
+        setStream(null);
 
-            if (status.result && status.result.status === "error") {
-              setError(status.result.detail || "Scrape failed");
+        const id = window.setInterval(async () => {
+          try {
+            const statusResp = await fetch(
+              "http://127.0.0.1:8000/scrape_status/" +
+                encodeURIComponent(jobId)
+            );
+            if (!statusResp.ok) return;
+
+            const status = await statusResp.json();
+
+            if (Array.isArray(status.logs)) {
+              setLogs(status.logs);
+            }
+
+            if (!status.running) {
+              window.clearInterval(id);
+              setPollId(null);
+              finish(status.result);
             }
+          } catch (err) {
+            console.error(err);
           }
-        } catch (err) {
-          console.error(err);
-        }
-      }, 1000);
+        }, 1000);
+
+        setPollId(id);
+      };
 
-      setPollId(id);
+      setStream(es);
     } catch (err: any) {
       console.error(err);
       setError(